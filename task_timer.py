@@ -1,66 +1,166 @@
-import sys, os, time, base64
+import sys, os, time, math, base64, weakref
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtCore import Qt, QTimer, QSize, QRect, QEvent, QAbstractListModel, QModelIndex, QRegularExpression
+from PyQt6.QtGui import QAction, QIcon, QColor, QFont, QFontMetrics, QRegularExpressionValidator
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QListWidget, QListWidgetItem, QLabel, QCheckBox, QSystemTrayIcon, QMenu
+    QListView, QLabel, QSystemTrayIcon, QMenu, QStyledItemDelegate, QStyle, QStyleOptionButton
 )
 
+try:
+    from win10toast import ToastNotifier
+except Exception:
+    ToastNotifier = None
+
 APP_NAME = "Task Timer"
 REMINDER_SECONDS = 5 * 60   # Fixed 5 minutes
+TOAST_COOLDOWN_SECONDS = 30
+ROW_HEIGHT = 46
+_TIMER_STRINGS = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(REMINDER_SECONDS + 1))
 
 ICON_B64 = (
     b"iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAASElEQVR4nO3PMQEAAAgDIN8/9K0h"
     b"YQAFu8y8CwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4M8B0wABk2sHn1wAAAABJRU5ErkJggg=="
 )
+_ICON_BYTES = base64.b64decode(ICON_B64)
+_CACHED_ICON: Optional[QIcon] = None
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str
     done: bool = False
 
-class TaskItem(QWidget):
-    def __init__(self, task: Task, on_toggle, on_remove):
+class TaskModel(QAbstractListModel):
+    DoneRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, tasks: List[Task]):
         super().__init__()
-        self.task = task
+        self.tasks = tasks
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tasks)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # Not ItemIsUserCheckable: toggling goes through TaskDelegate so MainWindow sees every change.
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self.tasks[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return task.title
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if task.done else Qt.CheckState.Unchecked
+        if role == TaskModel.DoneRole:
+            return task.done
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self.tasks[index.row()].done = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole, TaskModel.DoneRole])
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self.tasks):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.tasks[row:row + count]
+        self.endRemoveRows()
+        return True
+
+class TaskDelegate(QStyledItemDelegate):
+    def __init__(self, on_toggle, on_remove, parent=None):
+        super().__init__(parent)
         self.on_toggle = on_toggle
         self.on_remove = on_remove
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 6, 10, 6)
-        layout.setSpacing(8)
-
-        self.chk = QCheckBox()
-        self.chk.setChecked(self.task.done)
-        self.chk.stateChanged.connect(self.toggle)
-
-        self.lbl = QLabel(self.task.title)
-        self.lbl.setWordWrap(True)
-        self.update_style()
-
-        self.btn_remove = QPushButton("✕")
-        self.btn_remove.setFixedSize(26, 26)
-        self.btn_remove.clicked.connect(self.remove)
-
-        layout.addWidget(self.chk)
-        layout.addWidget(self.lbl, 1)
-        layout.addWidget(self.btn_remove)
-
-    def toggle(self):
-        self.on_toggle(self)
-        self.update_style()
-
-    def remove(self):
-        self.on_remove(self)
+    def layout_rects(self, rect: QRect, style: QStyle):
+        # Same geometry the old per-row widget layout produced: 10/6 margins, 8 spacing.
+        inner = rect.adjusted(10, 6, -10, -6)
+        ind = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth)
+        check = QRect(inner.left(), inner.center().y() - ind // 2, ind, ind)
+        remove = QRect(inner.right() - 25, inner.center().y() - 13, 26, 26)
+        text = QRect(check.right() + 9, inner.top(), remove.left() - check.right() - 17, inner.height())
+        return check, text, remove
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+
+        done = bool(index.data(TaskModel.DoneRole))
+        title = index.data(Qt.ItemDataRole.DisplayRole)
+        check_rect, text_rect, remove_rect = self.layout_rects(option.rect, style)
+
+        chk = QStyleOptionButton()
+        chk.rect = check_rect
+        chk.state = QStyle.StateFlag.State_Enabled | (QStyle.StateFlag.State_On if done else QStyle.StateFlag.State_Off)
+        style.drawControl(QStyle.ControlElement.CE_CheckBox, chk, painter, widget)
+
+        painter.save()
+        font = QFont(option.font)
+        font.setStrikeOut(done)
+        painter.setFont(font)
+        painter.setPen(QColor("#7aa97a") if done else option.palette.text().color())
+        # Plain single-line text: no rich-text parsing or word-wrap layout per row.
+        text = QFontMetrics(font).elidedText(f"✓ {title}" if done else title,
+                                             Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextSingleLine, text)
+        painter.restore()
+
+        btn = QStyleOptionButton()
+        btn.rect = remove_rect
+        btn.text = "✕"
+        btn.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        style.drawControl(QStyle.ControlElement.CE_PushButton, btn, painter, widget)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.KeyPress and event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+            self.on_toggle(index)
+            return True
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            widget = option.widget
+            style = widget.style() if widget else QApplication.style()
+            check_rect, _, remove_rect = self.layout_rects(option.rect, style)
+            pos = event.position().toPoint()
+            if remove_rect.contains(pos):
+                self.on_remove(index)
+                return True
+            if check_rect.contains(pos):
+                self.on_toggle(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+def build_tray_menu(window) -> QMenu:
+    # One menu per application; "Show" targets whichever window registered last.
+    app = QApplication.instance()
+    app._tt_current_window = weakref.ref(window)
+    menu = getattr(app, "_tt_tray_menu", None)
+    if menu is None:
+        menu = QMenu()
+        act_show = QAction("Show", menu)
+        act_show.triggered.connect(lambda: show_current_window(app))
+        act_quit = QAction("Quit", menu)
+        act_quit.triggered.connect(QApplication.quit)
+        menu.addAction(act_show)
+        menu.addAction(act_quit)
+        app._tt_tray_menu = menu
+    return menu
 
-    def update_style(self):
-        if self.task.done:
-            self.lbl.setText(f"<span style='color:#7aa97a;text-decoration:line-through'>✓ {self.task.title}</span>")
-        else:
-            self.lbl.setText(self.task.title)
+def show_current_window(app):
+    window = app._tt_current_window()
+    if window is not None:
+        window.show_window()
 
 class MainWindow(QWidget):
     def __init__(self):
@@ -72,6 +172,8 @@ class MainWindow(QWidget):
         self.setWindowIcon(self.icon)
 
         self.tasks: List[Task] = []
+        self.model = TaskModel(self.tasks)
+        self._pending = 0
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -83,6 +185,8 @@ class MainWindow(QWidget):
         row = QHBoxLayout()
         self.input = QLineEdit()
         self.input.setPlaceholderText("Type a task and press Enter…")
+        # Must contain a non-blank character, at most 200 after leading whitespace; Enter is ignored until it matches.
+        self.input.setValidator(QRegularExpressionValidator(QRegularExpression(r"^\s*\S.{0,199}$"), self.input))
         self.input.returnPressed.connect(self.add_task)
 
         self.btn_add = QPushButton("Add")
@@ -90,10 +194,13 @@ class MainWindow(QWidget):
         row.addWidget(self.input, 1)
         row.addWidget(self.btn_add)
 
-        self.timer_label = QLabel("05:00")
+        self.timer_label = QLabel(_TIMER_STRINGS[REMINDER_SECONDS])
         self.timer_hint = QLabel("Timer starts with the first task. Stops when all are done/removed.")
 
-        self.list = QListWidget()
+        self.list = QListView()
+        self.list.setModel(self.model)
+        self.list.setUniformItemSizes(True)
+        self.list.setItemDelegate(TaskDelegate(self.toggle_task, self.remove_task, self.list))
 
         foot = QHBoxLayout()
         self.count_label = QLabel("")
@@ -112,40 +219,56 @@ class MainWindow(QWidget):
 
         self.tray = QSystemTrayIcon(self.icon, self)
         self.tray.setToolTip(APP_NAME)
-        tray_menu = QMenu()
-        act_show = QAction("Show")
-        act_show.triggered.connect(self.show_window)
-        act_quit = QAction("Quit")
-        act_quit.triggered.connect(QApplication.quit)
-        tray_menu.addAction(act_show)
-        tray_menu.addAction(act_quit)
-        self.tray.setContextMenu(tray_menu)
+        self.tray.setContextMenu(build_tray_menu(self))
         self.tray.activated.connect(self.on_tray_activated)
         self.tray.show()
 
         self.seconds_left = REMINDER_SECONDS
+        self._last_rendered_secs = -1
+        self._deadline: Optional[float] = None
+        self._toaster = None
+        self._tray_available = QSystemTrayIcon.isSystemTrayAvailable()
+        self._last_toast_mono = 0.0
+        self.reminder = QTimer(self)
+        self.reminder.setSingleShot(True)
+        self.reminder.timeout.connect(self.on_deadline)
+        # Only drives the visible countdown; stopped while the window is hidden.
         self.tick = QTimer(self)
         self.tick.setInterval(1000)
         self.tick.timeout.connect(self.on_tick)
 
-        self.refresh_list()
         self.update_counter()
         self.reset_or_start()
 
     def load_icon(self) -> QIcon:
-        try:
-            from PyQt6.QtGui import QPixmap
-            pix = QPixmap()
-            pix.loadFromData(base64.b64decode(ICON_B64))
-            return QIcon(pix)
-        except Exception:
-            return QIcon()
+        global _CACHED_ICON
+        if _CACHED_ICON is None:
+            try:
+                from PyQt6.QtGui import QPixmap
+                pix = QPixmap()
+                pix.loadFromData(_ICON_BYTES)
+                _CACHED_ICON = QIcon(pix)
+            except Exception:
+                _CACHED_ICON = QIcon()
+        return _CACHED_ICON
 
     def show_window(self):
         self.show()
         self.raise_()
         self.activateWindow()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._deadline is not None:
+            self.on_tick()
+            self.tick.start()
+        else:
+            self.render_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.tick.stop()
+
     def closeEvent(self, event):
         event.ignore()
         self.hide()
@@ -159,86 +282,123 @@ class MainWindow(QWidget):
                 self.hide()
 
     def add_task(self):
-        text = self.input.text().strip()
-        if not text:
+        if not self.input.hasAcceptableInput():
             return
+        text = self.input.text().strip()
+        row = len(self.tasks)
+        self.model.beginInsertRows(QModelIndex(), row, row)
         self.tasks.append(Task(title=text))
+        self.model.endInsertRows()
+        self._pending += 1
         self.input.clear()
-        self.refresh_list()
         self.update_counter()
         self.reset_or_start(start_if_any=True)
 
-    def toggle_task(self, item_widget: TaskItem):
-        item_widget.task.done = not item_widget.task.done
+    def toggle_task(self, index: QModelIndex):
+        done = self.tasks[index.row()].done
+        self.model.setData(index, Qt.CheckState.Unchecked if done else Qt.CheckState.Checked,
+                           Qt.ItemDataRole.CheckStateRole)
+        self._pending += 1 if done else -1
         self.update_counter()
         self.reset_or_start()
 
-    def remove_task(self, item_widget: TaskItem):
-        self.tasks = [t for t in self.tasks if t is not item_widget.task]
-        self.refresh_list()
+    def remove_task(self, index: QModelIndex):
+        self.model.removeRows(index.row(), 1)
+        self._pending = sum(not t.done for t in self.tasks)
         self.update_counter()
         self.reset_or_start()
 
     def clear_done(self):
-        self.tasks = [t for t in self.tasks if not t.done]
-        self.refresh_list()
+        # Contiguous runs of done rows as (start, end); removed back to front so indices stay valid.
+        runs = []
+        removed = 0
+        for i, t in enumerate(self.tasks):
+            if not t.done:
+                continue
+            removed += 1
+            if runs and runs[-1][1] == i - 1:
+                runs[-1] = (runs[-1][0], i)
+            else:
+                runs.append((i, i))
+        if 2 * removed > len(self.tasks):
+            # Removing most of the list: one reset is cheaper than many row signals.
+            self.model.beginResetModel()
+            self.tasks[:] = [t for t in self.tasks if not t.done]
+            self.model.endResetModel()
+        else:
+            for start, end in reversed(runs):
+                self.model.removeRows(start, end - start + 1)
+        self._pending = sum(not t.done for t in self.tasks)
         self.update_counter()
         self.reset_or_start()
 
-    def refresh_list(self):
-        self.list.clear()
-        for t in self.tasks:
-            item = QListWidgetItem()
-            w = TaskItem(t, on_toggle=self.toggle_task, on_remove=self.remove_task)
-            item.setSizeHint(QSize(0, 46))
-            self.list.addItem(item)
-            self.list.setItemWidget(item, w)
-
     def update_counter(self):
-        remaining = sum(1 for t in self.tasks if not t.done)
-        total = len(self.tasks)
-        self.count_label.setText(f"Pending: {remaining} / Total: {total}")
+        self.count_label.setText(f"Pending: {self._pending} / Total: {len(self.tasks)}")
 
     def reset_or_start(self, start_if_any=False):
-        has_pending = any(not t.done for t in self.tasks)
-        if has_pending:
-            if start_if_any or not self.tick.isActive():
-                self.seconds_left = REMINDER_SECONDS
-                self.tick.start()
+        if self._pending > 0:
+            if start_if_any or self._deadline is None:
+                self.schedule_reminder()
         else:
+            self.reminder.stop()
             self.tick.stop()
+            self._deadline = None
             self.seconds_left = REMINDER_SECONDS
         self.render_timer()
 
+    def schedule_reminder(self):
+        self._deadline = time.monotonic() + REMINDER_SECONDS
+        self.seconds_left = REMINDER_SECONDS
+        self.reminder.start(REMINDER_SECONDS * 1000)
+        if self.isVisible():
+            self.tick.start()
+
+    def on_deadline(self):
+        if self._pending == 0:
+            self._deadline = None
+            return
+        self.fire_reminder()
+        self.schedule_reminder()
+        self.render_timer()
+
     def on_tick(self):
-        if not any(not t.done for t in self.tasks):
+        if self._deadline is None:
             self.tick.stop()
-            self.seconds_left = REMINDER_SECONDS
-            self.render_timer()
             return
-
-        self.seconds_left -= 1
-        if self.seconds_left <= 0:
-            self.fire_reminder()
-            self.seconds_left = REMINDER_SECONDS
+        self.seconds_left = max(0, math.ceil(self._deadline - time.monotonic()))
         self.render_timer()
 
     def render_timer(self):
-        m = self.seconds_left // 60
-        s = self.seconds_left % 60
-        self.timer_label.setText(f"{m:02d}:{s:02d}")
+        if self.isHidden() or self._last_rendered_secs == self.seconds_left:
+            return
+        self._last_rendered_secs = self.seconds_left
+        self.timer_label.setText(_TIMER_STRINGS[max(0, min(self.seconds_left, REMINDER_SECONDS))])
 
     def fire_reminder(self):
-        try:
-            from win10toast import ToastNotifier
-            toaster = ToastNotifier()
-            toaster.show_toast(
-                "Task Reminder",
-                "You have pending tasks! Stay focused.",
-                duration=10,
-                threaded=True
-            )
-        except:
+        now = time.monotonic()
+        if self._last_toast_mono and now - self._last_toast_mono < TOAST_COOLDOWN_SECONDS:
+            return
+        self._last_toast_mono = now
+        if self._toaster is None:
+            if ToastNotifier is None:
+                self._toaster = False
+            else:
+                try:
+                    self._toaster = ToastNotifier()
+                except Exception:
+                    self._toaster = False
+        if self._toaster:
+            try:
+                self._toaster.show_toast(
+                    "Task Reminder",
+                    "You have pending tasks! Stay focused.",
+                    duration=10,
+                    threaded=True
+                )
+                return
+            except Exception:
+                pass
+        if self._tray_available:
             self.tray.showMessage("Task Reminder", "You have pending tasks! Stay focused.", QSystemTrayIcon.MessageIcon.Information, 6000)
 
 if __name__ == "__main__":